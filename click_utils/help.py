@@ -27,6 +27,20 @@ class EnvHelpOption(click.Option):
                 return [envvar]
 
 
+_ENVHELP_SUBCLASS_CACHE = {click.Option: EnvHelpOption}
+
+
+def _envhelp_subclass(cls):
+    '''
+    return (and cache) a subclass of a given option class mixed with ``EnvHelpOption``
+    '''
+    subclass = _ENVHELP_SUBCLASS_CACHE.get(cls)
+    if subclass is None:
+        subclass = type('EnvHelp' + cls.__name__, (EnvHelpOption, cls), {})
+        _ENVHELP_SUBCLASS_CACHE[cls] = subclass
+    return subclass
+
+
 class EnvHelpCommand(click.Command):
     '''
     '''
@@ -40,8 +54,8 @@ class EnvHelpCommand(click.Command):
 
         if patch_options:
             for param in self.params:
-                if isinstance(param, click.Option):
-                    param.__class__ = EnvHelpOption
+                if isinstance(param, click.Option) and not isinstance(param, EnvHelpOption):
+                    param.__class__ = _envhelp_subclass(type(param))
 
         # if patch_subcommands:
         #     pass
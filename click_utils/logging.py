@@ -1,13 +1,18 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import
 
+import functools
 import logging
-import logging.config
 
 import click
 
 from . import defaults
 
+try:
+    from types import MappingProxyType as _read_only_dict
+except ImportError:  # Python 2 - fall back to a (mutable) per instance copy
+    _read_only_dict = dict
+
 
 class LogLevelChoice(click.Choice):
     '''
@@ -82,41 +87,75 @@ class LogLevelChoice(click.Choice):
         ('critical', logging.CRITICAL),
     )
 
+    _BASE_DICT = dict(LOGGING_LEVELS)
+    _BASE_KEYS = tuple(key for key, _ in LOGGING_LEVELS)
+
     @staticmethod
     def _convert_key(key):
         return key.lower().replace(' ', '')
 
     def __init__(self, *extra_levels):
-        self.logging_levels_dict = dict(self.LOGGING_LEVELS)
-        self.logging_level_keys = list(map(lambda x: x[0], self.LOGGING_LEVELS))
+        if not extra_levels:
+            # the common case - share the precomputed mappings
+            self.logging_levels_dict = _read_only_dict(self._BASE_DICT)
+            self.logging_level_keys = self._BASE_KEYS
+            super(LogLevelChoice, self).__init__(self._BASE_KEYS)
+            return
+
+        logging_levels_dict = dict(self._BASE_DICT)
+        logging_level_keys = list(self._BASE_KEYS)
         for extra_level in extra_levels:
             level_name = logging.getLevelName(extra_level)
             key = self._convert_key(level_name)
-            self.logging_levels_dict.update({key: extra_level})
-            self.logging_level_keys.append(key)
+            logging_levels_dict.update({key: extra_level})
+            logging_level_keys.append(key)
 
+        self.logging_levels_dict = _read_only_dict(logging_levels_dict)
+        self.logging_level_keys = tuple(logging_level_keys)
         super(LogLevelChoice, self).__init__(self.logging_level_keys)
 
     def convert(self, value, param, ctx):
-        lower_val = self._convert_key(value) if not isinstance(value, int) else '{0}'.format(value)
-        if lower_val.isdigit():
-            return int(lower_val)
-
-        result = super(LogLevelChoice, self).convert(lower_val, param, ctx)
+        if isinstance(value, int):
+            if value >= 0 and not isinstance(value, bool):
+                return value
+            # let negative numbers and booleans fail the validation below
+            value = '{0}'.format(value)
+
+        if value.isdigit():
+            return int(value)
+
+        # most of the time the value is already a normalized level name
+        if value.islower() and ' ' not in value:
+            key = value
+        else:
+            key = self._convert_key(value)
+            if key.isdigit():
+                return int(key)
+
+        level = self.logging_levels_dict.get(key)
+        if level is not None:
+            return level
+
+        result = super(LogLevelChoice, self).convert(key, param, ctx)
         return self.logging_levels_dict[result]
 
 
-def loglevel_callback_factory(ctx_loglevel_attr=None):
+# ``LogLevelChoice`` is read-only after initialization so a single default
+# instance can be shared by all the options created with ``loglevel_option``
+_DEFAULT_LOGLEVEL_CHOICE = LogLevelChoice()
 
-    def inner(ctx, param, value):
 
-        if not value or ctx.resilient_parsing:
-            return
-        if ctx_loglevel_attr:
-            setattr(ctx, ctx_loglevel_attr, value)
+def _loglevel_callback(ctx, param, value, ctx_loglevel_attr=None):
+    if not value or ctx.resilient_parsing:
+        return
+    if ctx_loglevel_attr:
+        setattr(ctx, ctx_loglevel_attr, value)
+
+    return value
 
-        return value
-    return inner
+
+def loglevel_callback_factory(ctx_loglevel_attr=None):
+    return functools.partial(_loglevel_callback, ctx_loglevel_attr=ctx_loglevel_attr)
 
 
 def loglevel_option(*param_decls, **attrs):
@@ -151,31 +190,38 @@ def loglevel_option(*param_decls, **attrs):
         attrs.setdefault('callback', default_callback)
         attrs.setdefault('is_eager', True)
 
-        attrs.setdefault('type', LogLevelChoice())
+        attrs.setdefault('type', _DEFAULT_LOGLEVEL_CHOICE)
         return click.option(*(param_decls or ('--loglevel',)), **attrs)(f)
     return decorator
 
 
+def _logconfig_callback(ctx, param, value, defaults=None, disable_existing_loggers=False):
+    if not value or ctx.resilient_parsing:
+        return
+    # imported lazily since it's a heavy import that is not needed otherwise
+    from logging import config as logging_config
+    logging_config.fileConfig(value,
+                              defaults=defaults,
+                              disable_existing_loggers=disable_existing_loggers)
+    return value
+
+
 def logconfig_callback_factory(defaults=None, disable_existing_loggers=False):
     '''
     a factory for creating parametrized callbacks to invoke ``logging.config.fileConfig``
     '''
-    def inner(ctx, param, value):
-        if not value or ctx.resilient_parsing:
-            return
-        logging.config.fileConfig(value,
-                                  defaults=defaults,
-                                  disable_existing_loggers=disable_existing_loggers)
-        return value
-    return inner
+    return functools.partial(_logconfig_callback,
+                             defaults=defaults,
+                             disable_existing_loggers=disable_existing_loggers)
 
-logconfig_callback = logconfig_callback_factory()
 
-logconfig_callback.__doc__ = '''
-a default callback for invoking::
+def logconfig_callback(ctx, param, value):
+    '''
+    a default callback for invoking::
 
-    logging.config.fileConfig(value, defaults=None, disable_existing_loggers=False)
-'''
+        logging.config.fileConfig(value, defaults=None, disable_existing_loggers=False)
+    '''
+    return _logconfig_callback(ctx, param, value)
 
 
 def logconfig_option(*param_decls, **attrs):
@@ -240,6 +286,41 @@ def logconfig_option(*param_decls, **attrs):
     return decorator
 
 
+def _logger_callback(ctx, param, value, logger_name='',
+                     handler_cls=None, handler_attrs=None,
+                     formatter_cls=None, formatter_attrs=None,
+                     filters=None,
+                     level=None, ctx_loglevel_attr=None,
+                     ctx_key=None):
+
+    if not value or ctx.resilient_parsing:
+        return
+
+    handler = handler_cls(value, **handler_attrs)
+
+    if formatter_cls is not None:
+        formatter = formatter_cls(**formatter_attrs)
+        handler.setFormatter(formatter)
+
+    if level is None:
+        level = getattr(ctx, ctx_loglevel_attr, defaults.LOGLEVEL)
+
+    handler.setLevel(level)
+
+    logger = logging.getLogger(logger_name)
+    logger.addHandler(handler)
+    logger.setLevel(level)
+
+    for filter_function in filters:
+        logger.addFilter(filter_function)
+
+    # save it in context if ``ctx_key`` was passed
+    if ctx_key:
+        setattr(ctx, ctx_key, logger)
+
+    return value
+
+
 def logger_callback_factory(logger_name='',
                             handler_cls=None, handler_attrs=None,
                             formatter_cls=None, formatter_attrs=None,
@@ -250,39 +331,18 @@ def logger_callback_factory(logger_name='',
     handler_attrs = handler_attrs if handler_attrs else {}
     formatter_attrs = formatter_attrs if formatter_attrs else {}
     filters = filters if filters else ()
-    given_level = level
     ctx_loglevel_attr = ctx_loglevel_attr if ctx_loglevel_attr else defaults.CONTEXT_LOGLEVEL_ATTR
 
-    def inner(ctx, param, value):
-
-        if not value or ctx.resilient_parsing:
-            return
-
-        handler = handler_cls(value, **handler_attrs)
-
-        if formatter_cls is not None:
-            formatter = formatter_cls(**formatter_attrs)
-            handler.setFormatter(formatter)
-
-        level = given_level
-        if level is None:
-            level = getattr(ctx, ctx_loglevel_attr, defaults.LOGLEVEL)
-
-        handler.setLevel(level)
-
-        logger = logging.getLogger(logger_name)
-        logger.addHandler(handler)
-        logger.setLevel(level)
-
-        for filter_function in filters:
-            logger.addFilter(filter_function)
-
-        # save it in context if ``ctx_key`` was passed
-        if ctx_key:
-            setattr(ctx, ctx_key, logger)
-
-        return value
-    return inner
+    return functools.partial(_logger_callback,
+                             logger_name=logger_name,
+                             handler_cls=handler_cls,
+                             handler_attrs=handler_attrs,
+                             formatter_cls=formatter_cls,
+                             formatter_attrs=formatter_attrs,
+                             filters=filters,
+                             level=level,
+                             ctx_loglevel_attr=ctx_loglevel_attr,
+                             ctx_key=ctx_key)
 
 
 def logger_option(*param_decls, **attrs):
@@ -345,6 +405,9 @@ def logfile_option(*param_decls, **attrs):
     '''
 
     def decorator(f):
+        # imported lazily since it's a heavy import that is not needed otherwise
+        from logging.handlers import RotatingFileHandler
+
         path_type = click.Path(exists=False, file_okay=True, dir_okay=False,
                                writable=True, readable=True, resolve_path=True)
         attrs.setdefault('type', path_type)
@@ -356,7 +419,7 @@ def logfile_option(*param_decls, **attrs):
         backupCount = attrs.pop('backupCount', defaults.BACKUPCOUNT)
 
         # logger_option attrs
-        attrs.setdefault('handler_cls', logging.handlers.RotatingFileHandler),
+        attrs.setdefault('handler_cls', RotatingFileHandler),
         attrs.setdefault('handler_attrs', {'maxBytes': maxBytes, 'backupCount': backupCount}),
         attrs.setdefault('formatter_cls', logging.Formatter),
         attrs.setdefault('formatter_attrs', {'fmt': fmt, 'datefmt': datefmt}),
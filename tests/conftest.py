@@ -1,8 +1,56 @@
+import logging
+
 from click.testing import CliRunner
 
 import pytest
 
 
-@pytest.fixture(scope='function')
+# module level registries of logging levels differ between Python versions
+LOGGING_LEVEL_REGISTRIES = [getattr(logging, name) for name in ('_levelNames', '_levelToName', '_nameToLevel')
+                            if hasattr(logging, name)]
+
+
+@pytest.fixture(scope='session')
 def runner(request):
     return CliRunner()
+
+
+def _logger_state(logger):
+    return logger.handlers[:], logger.filters[:], logger.level, logger.disabled
+
+
+@pytest.fixture(autouse=True)
+def logging_reset():
+    '''
+    restore the global ``logging`` state after each test: the registry of loggers,
+    handlers, filters and levels of every logger (including root) and level names.
+    Handlers added during a test are closed.
+    '''
+    manager = logging.Logger.manager
+    saved_loggers = manager.loggerDict.copy()
+    loggers = [logging.getLogger()] + [logger for logger in saved_loggers.values()
+                                       if isinstance(logger, logging.Logger)]
+    saved_states = [(logger, _logger_state(logger)) for logger in loggers]
+    saved_registries = [registry.copy() for registry in LOGGING_LEVEL_REGISTRIES]
+
+    yield
+
+    for name, logger in list(manager.loggerDict.items()):
+        if name not in saved_loggers and isinstance(logger, logging.Logger):
+            for handler in logger.handlers:
+                handler.close()
+    manager.loggerDict.clear()
+    manager.loggerDict.update(saved_loggers)
+
+    for logger, (handlers, filters, level, disabled) in saved_states:
+        for handler in logger.handlers:
+            if handler not in handlers:
+                handler.close()
+        logger.handlers[:] = handlers
+        logger.filters[:] = filters
+        logger.setLevel(level)
+        logger.disabled = disabled
+
+    for registry, saved in zip(LOGGING_LEVEL_REGISTRIES, saved_registries):
+        registry.clear()
+        registry.update(saved)
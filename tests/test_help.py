@@ -51,3 +51,49 @@ def test_help_command(runner):
     assert '--option_b TEXT  [env: BVAR, B_VAR]' in out
     assert '--option_c TEXT  [env: CLI_OPTION_C]' in out
     assert '--option_d TEXT  [env: ' not in out
+
+
+def test_help_command_custom_option_class(runner):
+
+    class CustomOption(click.Option):
+        pass
+
+    def callback(option_a):
+        click.echo(option_a)
+
+    option = CustomOption(['--option_a'], envvar='OPTIONA')
+    cli = click_utils.EnvHelpCommand('cli', params=[option], callback=callback)
+
+    assert isinstance(option, CustomOption)
+    assert isinstance(option, click_utils.help.EnvHelpOption)
+
+    result = runner.invoke(cli, ['--help'], catch_exceptions=False)
+    assert '--option_a TEXT  [env: OPTIONA]' in result.output
+
+
+def test_help_command_envvar_changes(runner):
+    @click.command(cls=click_utils.EnvHelpCommand)
+    @click.option('--option_c', )
+    def cli(option_c):
+        click.echo(option_c)
+
+    result = runner.invoke(cli, ['--help'], catch_exceptions=False, auto_envvar_prefix='CLI')
+    assert '--option_c TEXT  [env: CLI_OPTION_C]' in result.output
+
+    # a different prefix gives a different envvar
+    result = runner.invoke(cli, ['--help'], catch_exceptions=False, auto_envvar_prefix='OTHER')
+    assert '--option_c TEXT  [env: OTHER_OPTION_C]' in result.output
+
+    result = runner.invoke(cli, ['--help'], catch_exceptions=False, auto_envvar_prefix='CLI')
+    assert '--option_c TEXT  [env: CLI_OPTION_C]' in result.output
+
+    # changing option attributes after a render is reflected in help
+    option = cli.params[0]
+    option.envvar = 'X'
+    result = runner.invoke(cli, ['--help'], catch_exceptions=False, auto_envvar_prefix='CLI')
+    assert '--option_c TEXT  [env: X]' in result.output
+
+    option.envvar = None
+    option.allow_from_autoenv = False
+    result = runner.invoke(cli, ['--help'], catch_exceptions=False, auto_envvar_prefix='CLI')
+    assert '--option_c TEXT  [env: ' not in result.output
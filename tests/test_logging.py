@@ -1,29 +1,88 @@
 # -*- coding: utf-8 -*-
 
 import logging
+import logging.handlers
+import os
+import subprocess
+import sys
 import click
+import pytest
 import textwrap
 
 import click_utils
 
 
-def test_loglevel_type(runner):
-    '''
-    test a typical case with deafult log levels
-    '''
+@pytest.fixture(scope='module')
+def loglevel_cli():
 
     @click.command()
     @click.option('--loglevel', type=click_utils.LogLevelChoice())
     def cli(loglevel):
-        click.echo('loglevel: {0}'.format(loglevel))
+        click.echo('loglevel: {0!r}'.format(loglevel))
+
+    return cli
+
+
+@pytest.fixture(scope='session')
+def logdir(tmpdir_factory):
+    return tmpdir_factory.mktemp('logfiles')
+
+
+LOGLEVEL_CASES = [
+    ('error', '40'),
+    ('WARNING', '30'),
+    ('123', '123'),
+]
+
+
+LOGCONFIG_CONTENT = textwrap.dedent('''
+    [loggers]
+    keys=root,clickutils_logger
+
+    [handlers]
+    keys=hand01
+
+    [formatters]
+    keys=form01
+
+    [handler_hand01]
+    class=handlers.MemoryHandler
+    level=DEBUG
+    formatter=form01
+    args=(1024,)
+
+    [formatter_form01]
+    format=F1 %(asctime)s %(levelname)s %(message)s
+    datefmt=
+    class=logging.Formatter
+
+    [logger_clickutils_logger]
+    level=CRITICAL
+    handlers=hand01
+    qualname=clickutils_test_logger
+
+    [logger_root]
+    handlers=hand01
+''')
+
+
+def test_loglevel_type(loglevel_cli):
+    '''
+    test a typical case with deafult log levels
+    '''
+    option = next(param for param in loglevel_cli.params if param.name == 'loglevel')
 
-    result = runner.invoke(cli,  ['--loglevel=error'], catch_exceptions=False)
+    assert list(option.type.choices) == ['notset', 'debug', 'info', 'warning', 'error', 'critical']
 
-    assert result.output == 'loglevel: 40\n'
 
-    result = runner.invoke(cli,  ['--help'])
+@pytest.mark.parametrize('arg,expected', LOGLEVEL_CASES)
+def test_loglevel_input(runner, loglevel_cli, arg, expected):
+    '''
+    test that level names (in any case) and numbers are converted to an int loglevel
+    '''
+    result = runner.invoke(loglevel_cli,  ['--loglevel={0}'.format(arg)], catch_exceptions=False)
 
-    assert '--loglevel [notset|debug|info|warning|error|critical]' in result.output
+    assert result.output == 'loglevel: {0}\n'.format(expected)
 
 
 def test_loglevel_type_extra(runner):
@@ -38,40 +97,21 @@ def test_loglevel_type_extra(runner):
     def cli(loglevel):
         click.echo('loglevel: {0}'.format(loglevel))
 
-    result = runner.invoke(cli,  ['--help'])
+    option = next(param for param in cli.params if param.name == 'loglevel')
 
-    assert '--loglevel [notset|debug|info|warning|error|critical|level101|mytestlevel]' in result.output
+    assert list(option.type.choices) == ['notset', 'debug', 'info', 'warning', 'error', 'critical',
+                                         'level101', 'mytestlevel']
 
     result = runner.invoke(cli,  ['--loglevel=mytestlevel'], catch_exceptions=False)
 
     assert result.output == 'loglevel: 102\n'
 
 
-def test_loglevel_numeric_input(runner):
-    '''
-    test a special case where user inputted a number loglevel instead of a level name
-    '''
-    @click.command()
-    @click.option('--loglevel', type=click_utils.LogLevelChoice())
-    def cli(loglevel):
-        assert isinstance(loglevel, int)
-        click.echo('loglevel: {0}'.format(loglevel))
-
-    result = runner.invoke(cli,  ['--loglevel=123'], catch_exceptions=False)
-
-    assert result.output == 'loglevel: 123\n'
-
-
-def test_loglevel_wrong_input(runner):
+def test_loglevel_wrong_input(runner, loglevel_cli):
     '''
     test invokation with wrong input
     '''
-    @click.command()
-    @click.option('--loglevel', type=click_utils.LogLevelChoice())
-    def cli(loglevel):
-        click.echo('loglevel: {0}'.format(loglevel))
-
-    result = runner.invoke(cli,  ['--loglevel=nonexistentlevel'], catch_exceptions=True)
+    result = runner.invoke(loglevel_cli,  ['--loglevel=nonexistentlevel'], catch_exceptions=True)
 
     assert result.exit_code != 0
     assert 'Invalid value for "--loglevel": invalid choice: nonexistentlevel' in result.output
@@ -109,64 +149,22 @@ def test_loglevel_decorator_custom(runner):
     assert result.output == '20\n'
 
 
-def test_loglevel_uppercase(runner):
-    '''
-    test invokation with uppercased level name
-    '''
-    @click.command()
-    @click.option('--loglevel', type=click_utils.LogLevelChoice())
-    def cli(loglevel):
-        click.echo('loglevel: {0}'.format(loglevel))
-
-    result = runner.invoke(cli,  ['--loglevel=WARNING'], catch_exceptions=False)
-
-    assert result.output == 'loglevel: 30\n'
-
-
 def test_logconfig_option(runner, tmpdir):
     '''
     test logging configuration via logconfig option
     '''
     tmp_file = tmpdir.join('logging.conf')
-    conf_content = textwrap.dedent('''
-        [loggers]
-        keys=root,clickutils_logger
 
-        [handlers]
-        keys=hand01
-
-        [formatters]
-        keys=form01
-
-        [handler_hand01]
-        class=FileHandler
-        level=DEBUG
-        formatter=form01
-        args=('/dev/null',)
-
-        [formatter_form01]
-        format=F1 %(asctime)s %(levelname)s %(message)s
-        datefmt=
-        class=logging.Formatter
-
-        [logger_clickutils_logger]
-        level=CRITICAL
-        handlers=hand01
-        qualname=clickutils_test_logger
-
-        [logger_root]
-        handlers=hand01
-    ''')
-
-    tmp_file.write(conf_content)
+    tmp_file.write(LOGCONFIG_CONTENT)
 
     @click.command()
     @click_utils.logconfig_option()
     def cli():
         pass
 
-    # invoking without configfile shouldn't change anything
-    runner.invoke(cli, catch_exceptions=False)
+    # a callback without configfile shouldn't change anything
+    option = next(param for param in cli.params if param.name == 'logconfig')
+    assert option.callback(None, option, None) is None
     test_logger = logging.getLogger('clickutils_test_logger')
     assert len(test_logger.handlers) == 0
 
@@ -179,11 +177,11 @@ def test_logconfig_option(runner, tmpdir):
     assert test_logger.level == logging.CRITICAL
 
 
-def test_logfile_option(runner, tmpdir):
+def test_logfile_option(runner, logdir, request):
     '''
     test a simple case with a logfile option
     '''
-    tmp_file = tmpdir.mkdir('logfiles').join('test.log')
+    tmp_file = logdir.join('{0}.log'.format(request.node.name))
     test_logger_name = 'click_utils_test_logfile_option_loger_name'
 
     @click.command()
@@ -191,8 +189,9 @@ def test_logfile_option(runner, tmpdir):
     def cli():
         pass
 
-    # invoking without logfile shouldn't change anything
-    runner.invoke(cli, catch_exceptions=False)
+    # a callback without logfile shouldn't change anything
+    option = next(param for param in cli.params if param.name == 'logfile')
+    assert option.callback(None, option, None) is None
     test_logger = logging.getLogger(test_logger_name)
     assert len(test_logger.handlers) == 0
 
@@ -203,11 +202,11 @@ def test_logfile_option(runner, tmpdir):
     assert isinstance(test_logger.handlers[0], logging.handlers.RotatingFileHandler)
 
 
-def test_logfile_option_with_loglevel_option(runner, tmpdir):
+def test_logfile_option_with_loglevel_option(runner, logdir, request):
     '''
     test logfile with loglevel and the retrieval of level from context
     '''
-    tmp_file = tmpdir.mkdir('logfiles').join('test.log')
+    tmp_file = logdir.join('{0}.log'.format(request.node.name))
     test_logger_name = 'click_utils_test_logfile_option_with_loglevel_option_loger_name'
 
     @click.command()
@@ -216,8 +215,9 @@ def test_logfile_option_with_loglevel_option(runner, tmpdir):
     def cli():
         pass
 
-    # invoking without logfile shouldn't change anything
-    runner.invoke(cli, catch_exceptions=False)
+    # a callback without logfile shouldn't change anything
+    option = next(param for param in cli.params if param.name == 'logfile')
+    assert option.callback(None, option, None) is None
     test_logger = logging.getLogger(test_logger_name)
     assert len(test_logger.handlers) == 0
 
@@ -230,12 +230,12 @@ def test_logfile_option_with_loglevel_option(runner, tmpdir):
     assert test_logger.level == logging.CRITICAL
 
 
-def test_logfile_option_with_storing(runner, tmpdir):
+def test_logfile_option_with_storing(runner, logdir, request):
     '''
     test that storing a logger on context (from logfile_option) works
     '''
-    tmp_file = tmpdir.mkdir('logfiles').join('test.log')
-    tmp_file2 = tmpdir.mkdir('logfiles2').join('test2.log')
+    tmp_file = logdir.join('{0}.log'.format(request.node.name))
+    tmp_file2 = logdir.join('{0}_default.log'.format(request.node.name))
     test_logger_name = 'click_utils_test_logfile_option_with_storing_loger_name'
 
     @click.command()
@@ -261,11 +261,11 @@ def test_logfile_option_with_storing(runner, tmpdir):
     assert test_logger.handlers[1].baseFilename == tmp_file.strpath
 
 
-def test_logfile_option_with_filters(runner, tmpdir):
+def test_logfile_option_with_filters(runner, logdir, request):
     '''
     test that passing an iterable of filters to logfile_option works
     '''
-    tmp_file = tmpdir.mkdir('logfiles').join('test.log')
+    tmp_file = logdir.join('{0}.log'.format(request.node.name))
     test_logger_name = 'click_utils_test_logfile_option_with_filters_loger_name'
 
     class CustomFilter(logging.Filter):
@@ -303,3 +303,52 @@ def test_default_int_loglevel(runner):
 
     assert result.exit_code == 0
     assert result.output == '40\n'
+
+
+@pytest.mark.skipif(sys.version_info < (3, 3), reason='read-only mappings require types.MappingProxyType')
+def test_loglevel_type_read_only():
+    '''
+    test that level mappings can't be mutated (they are shared between instances)
+    '''
+    for choice in (click_utils.LogLevelChoice(), click_utils.LogLevelChoice(101)):
+        assert isinstance(choice.logging_level_keys, tuple)
+        with pytest.raises(TypeError):
+            choice.logging_levels_dict['custom'] = 1
+
+    assert 'custom' not in click_utils.LogLevelChoice().logging_levels_dict
+
+
+@pytest.mark.parametrize('value', [-5, True, '-5'])
+def test_loglevel_type_invalid_values(value):
+    '''
+    test that negative numbers and booleans are rejected
+    '''
+    with pytest.raises(click.BadParameter):
+        click_utils.LogLevelChoice().convert(value, None, None)
+
+
+def test_loglevel_type_extra_non_ascii():
+    '''
+    test a custom logging level with a non-ASCII name
+    '''
+    logging.addLevelName(105, u'Niveau Élevé')
+
+    choice = click_utils.LogLevelChoice(105)
+
+    assert choice.logging_level_keys[-1] == u'niveauélevé'
+    assert choice.convert(u'niveauélevé', None, None) == 105
+    assert choice.convert(u'NIVEAU ÉLEVÉ', None, None) == 105
+
+
+def test_lazy_logging_imports():
+    '''
+    test that importing click_utils doesn't import ``logging.config`` and ``logging.handlers``
+    '''
+    code = 'import sys, click_utils; print(sorted(set(["logging.config", "logging.handlers"]) & set(sys.modules)))'
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    process = subprocess.Popen([sys.executable, '-c', code], cwd=root, stdout=subprocess.PIPE)
+    output = process.communicate()[0]
+
+    assert process.returncode == 0
+
+    assert output.decode('ascii').strip() == '[]'